@@ -1,14 +1,32 @@
-import subprocess
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+
 from resources import constants
 
 patcher_support_pkg_version = constants.Constants().patcher_support_pkg_version
 binary_packages = ["10.14-Mojave", "10.15-Catalina", "11-Big-Sur", "12-Monterey"]
 
-for binary_package in binary_packages:
+# Share a single session so TCP/TLS connections are pooled across
+# the github.com -> objects.githubusercontent.com redirect
+session = requests.Session()
+# Retry transient failures instead of requiring a manual rerun
+session.mount("https://", requests.adapters.HTTPAdapter(max_retries=requests.adapters.Retry(total=3, backoff_factor=2)))
+
+
+def download_package(binary_package):
     print(f"- Downloading {binary_package}...")
-    download_cmd = f"curl -LO https://github.com/dortania/PatcherSupportPkg/releases/download/0.3.8/{binary_package}.zip"
-    subprocess.run(download_cmd, shell=True)
-    print("- Moving into payloads")
-    move_cmd = f"mv {binary_package}.zip ./payloads/"
-    subprocess.run(move_cmd, shell=True)
+    link = f"https://github.com/dortania/PatcherSupportPkg/releases/download/{patcher_support_pkg_version}/{binary_package}.zip"
+    with session.get(link, stream=True) as response:
+        response.raise_for_status()
+        with (Path("./payloads") / f"{binary_package}.zip").open("wb") as file:
+            shutil.copyfileobj(response.raw, file)
+    print(f"- Finished downloading {binary_package}")
+
+
+# Downloads are network-bound, so fetch all packages concurrently
+with ThreadPoolExecutor(max_workers=4) as executor:
+    list(executor.map(download_package, binary_packages))
 print("- Download complete")
@@ -1559,6 +1559,9 @@ class wx_python_gui:
                 # though highly unlikely this thread is still alive (flashing an Installer will take a while)
                 time.sleep(0.1)
             print("- Installing Root Patcher to drive")
+            # createinstallmedia just repartitioned the disk, any cached
+            # diskutil info for it is now stale
+            utilities.get_diskutil_info.cache_clear()
             self.install_installer_pkg(self.target_disk)
             self.finished_cim_process = True
         else:
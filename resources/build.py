@@ -33,7 +33,7 @@ class BuildOpenCore:
         self.gfx0_path = None
 
     def disk_type(self):
-        drive_host_info = plistlib.loads(subprocess.run(f"diskutil info -plist {self.constants.disk}".split(), stdout=subprocess.PIPE).stdout.decode().strip().encode())
+        drive_host_info = plistlib.loads(subprocess.run(f"diskutil info -plist {self.constants.disk}".split(), stdout=subprocess.PIPE).stdout)
         sd_type = drive_host_info["MediaName"]
         try:
             ssd_type = drive_host_info["SolidState"]
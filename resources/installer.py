@@ -2,7 +2,6 @@
 from pathlib import Path
 import plistlib
 import subprocess
-import requests
 from resources import utilities
 
 def list_local_macOS_installers():
@@ -118,7 +117,7 @@ def list_downloadable_macOS_installers(download_path, catalog):
     
     if utilities.verify_network_connection(link) is True:
         try:
-            catalog_plist = plistlib.loads(requests.get(link).content)
+            catalog_plist = plistlib.loads(utilities.get_session().get(link).content)
         except plistlib.InvalidFileException:
             return available_apps
 
@@ -132,7 +131,7 @@ def list_downloadable_macOS_installers(download_path, catalog):
                 for bm_package in catalog_plist["Products"][item]["Packages"]:
                     if "Info.plist" in bm_package["URL"] and "InstallInfo.plist" not in bm_package["URL"]:
                         try:
-                            build_plist = plistlib.loads(requests.get(bm_package["URL"]).content)
+                            build_plist = plistlib.loads(utilities.get_session().get(bm_package["URL"]).content)
                         except plistlib.InvalidFileException:
                             continue
                         version = build_plist["MobileAssetProperties"]["OSVersion"]
@@ -253,12 +252,12 @@ def select_disk_to_format():
     # TODO: AllDisksAndPartitions is not supported in Snow Leopard and older
     try:
         # High Sierra and newer
-        disks = plistlib.loads(subprocess.run("diskutil list -plist physical".split(), stdout=subprocess.PIPE).stdout.decode().strip().encode())
+        disks = plistlib.loads(subprocess.run("diskutil list -plist physical".split(), stdout=subprocess.PIPE).stdout)
     except ValueError:
         # Sierra and older
-        disks = plistlib.loads(subprocess.run("diskutil list -plist".split(), stdout=subprocess.PIPE).stdout.decode().strip().encode())
+        disks = plistlib.loads(subprocess.run("diskutil list -plist".split(), stdout=subprocess.PIPE).stdout)
     for disk in disks["AllDisksAndPartitions"]:
-        disk_info = plistlib.loads(subprocess.run(f"diskutil info -plist {disk['DeviceIdentifier']}".split(), stdout=subprocess.PIPE).stdout.decode().strip().encode())
+        disk_info = plistlib.loads(subprocess.run(f"diskutil info -plist {disk['DeviceIdentifier']}".split(), stdout=subprocess.PIPE).stdout)
         try:
             all_disks[disk["DeviceIdentifier"]] = {"identifier": disk_info["DeviceNode"], "name": disk_info["MediaName"], "size": disk_info["TotalSize"], "removable": disk_info["Internal"], "partitions": {}}
         except KeyError:
@@ -297,12 +296,12 @@ def list_disk_to_format():
     # TODO: AllDisksAndPartitions is not supported in Snow Leopard and older
     try:
         # High Sierra and newer
-        disks = plistlib.loads(subprocess.run("diskutil list -plist physical".split(), stdout=subprocess.PIPE).stdout.decode().strip().encode())
+        disks = plistlib.loads(subprocess.run("diskutil list -plist physical".split(), stdout=subprocess.PIPE).stdout)
     except ValueError:
         # Sierra and older
-        disks = plistlib.loads(subprocess.run("diskutil list -plist".split(), stdout=subprocess.PIPE).stdout.decode().strip().encode())
+        disks = plistlib.loads(subprocess.run("diskutil list -plist".split(), stdout=subprocess.PIPE).stdout)
     for disk in disks["AllDisksAndPartitions"]:
-        disk_info = plistlib.loads(subprocess.run(f"diskutil info -plist {disk['DeviceIdentifier']}".split(), stdout=subprocess.PIPE).stdout.decode().strip().encode())
+        disk_info = plistlib.loads(subprocess.run(f"diskutil info -plist {disk['DeviceIdentifier']}".split(), stdout=subprocess.PIPE).stdout)
         try:
             all_disks[disk["DeviceIdentifier"]] = {"identifier": disk_info["DeviceNode"], "name": disk_info["MediaName"], "size": disk_info["TotalSize"], "removable": disk_info["Internal"], "partitions": {}}
         except KeyError:
@@ -33,6 +33,7 @@ CFAllocatorRef = b"^{__CFAllocator=}"
 functions = [
     ("IORegistryEntryCreateCFProperties", b"IIo^@" + CFAllocatorRef + b"I"),
     ("IOServiceMatching", CFDictionaryRef + b"r*"),
+    ("IOServiceGetMatchingService", b"II" + CFDictionaryRef),
     ("IOServiceGetMatchingServices", b"II" + CFDictionaryRef + b"o^I"),
     ("IOIteratorNext", b"II"),
     ("IORegistryEntryGetParentEntry", b"IIr*o^I"),
@@ -101,6 +102,11 @@ def IOServiceMatching(name: bytes) -> dict:  # pylint: disable=invalid-name
     raise NotImplementedError
 
 
+# io_service_t IOServiceGetMatchingService(mach_port_t masterPort, CFDictionaryRef matching CF_RELEASES_ARGUMENT);
+def IOServiceGetMatchingService(masterPort: mach_port_t, matching: dict) -> io_object_t:  # pylint: disable=invalid-name
+    raise NotImplementedError
+
+
 # kern_return_t IOServiceGetMatchingServices(mach_port_t masterPort, CFDictionaryRef matching CF_RELEASES_ARGUMENT, io_iterator_t * existing);
 def IOServiceGetMatchingServices(masterPort: mach_port_t, matching: dict, existing: pointer) -> tuple[kern_return_t, io_iterator_t]:  # pylint: disable=invalid-name
     raise NotImplementedError
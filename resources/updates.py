@@ -2,9 +2,10 @@
 # Check whether new updates are available for OpenCore Legacy Patcher binary
 # Call check_binary_updates() to determine if any updates are available
 # Returns dict with Link and Version of the latest binary update if available
-import requests
 from pathlib import Path
 
+from resources import utilities
+
 
 class check_binary_updates:
     def __init__(self, constants):
@@ -17,16 +18,7 @@ class check_binary_updates:
         self.available_binaries = {}
 
     def verify_network_connection(self, url):
-        try:
-            response = requests.head(url, timeout=5)
-            if response:
-                return True
-        except (requests.exceptions.Timeout,
-                requests.exceptions.TooManyRedirects,
-                requests.exceptions.ConnectionError,
-                requests.exceptions.HTTPError):
-            return False
-        return False
+        return utilities.verify_network_connection(url)
 
     def check_if_build_newer(self):
         if self.remote_version_array[0] > self.binary_version_array[0]:
@@ -73,7 +65,7 @@ class check_binary_updates:
         # print("- Checking for updates...")
         if self.verify_network_connection(self.binary_url):
             # print("- Network connection functional")
-            response = requests.get(self.binary_url)
+            response = utilities.get_session().get(self.binary_url)
             data_set = response.json()
             # print("- Retrived latest version data")
             self.remote_version = data_set["tag_name"]
@@ -2,43 +2,56 @@
 from __future__ import print_function
 
 import hashlib
+import http.client
 import math
 import os
 import plistlib
+import signal
 import subprocess
+import sys
 from pathlib import Path
+from urllib.parse import urlsplit
 import os
 import binascii
 import argparse
+import functools
 from ctypes import CDLL, c_uint, byref
 import time
 
-try:
-    import requests
-except ImportError:
-    subprocess.run(["pip3", "install", "requests"], stdout=subprocess.PIPE)
-    try:
-        import requests
-    except ImportError:
-        raise Exception("Missing requests library!\nPlease run the following before starting OCLP:\npip3 install requests")
-
 from resources import constants, ioreg
 from data import sip_data, os_data
 
+# Shared session, so repeated downloads reuse pooled TCP/TLS connections.
+# Populated lazily, only the streaming download path needs requests
+SESSION = None
+
+
+def get_session():
+    global SESSION  # pylint: disable=global-statement # We need to cache the result
+
+    if SESSION is None:
+        try:
+            import requests
+        except ImportError:
+            subprocess.run(["pip3", "install", "requests"], stdout=subprocess.PIPE)
+            try:
+                import requests
+            except ImportError:
+                raise Exception("Missing requests library!\nPlease run the following before starting OCLP:\npip3 install requests")
+        SESSION = requests.Session()
+
+    return SESSION
+
 
 def hexswap(input_hex: str):
-    hex_pairs = [input_hex[i : i + 2] for i in range(0, len(input_hex), 2)]
-    hex_rev = hex_pairs[::-1]
-    hex_str = "".join(["".join(x) for x in hex_rev])
-    return hex_str.upper()
+    # Byte-swap entirely in C: hex string -> bytes, reverse, back to hex
+    return binascii.unhexlify(input_hex)[::-1].hex().upper()
 
 
 def string_to_hex(input_string):
     if not (len(input_string) % 2) == 0:
         input_string = "0" + input_string
-    input_string = hexswap(input_string)
-    input_string = binascii.unhexlify(input_string)
-    return input_string
+    return binascii.unhexlify(input_string)[::-1]
 
 
 def process_status(process_result):
@@ -48,22 +61,38 @@ def process_status(process_result):
         raise Exception(f"Process result: \n{process_result.stdout.decode()}")
 
 
+HUMAN_FMT_UNITS = ("B", "KB", "MB", "GB", "TB", "PB", "EB")
+
+
 def human_fmt(num):
-    for unit in ["B", "KB", "MB", "GB", "TB", "PB"]:
-        if abs(num) < 1000.0:
-            return "%3.1f %s" % (num, unit)
-        num /= 1000.0
-    return "%.1f %s" % (num, "EB")
+    # Pick the unit in constant time, rather than dividing until the value fits
+    magnitude = abs(num)
+    if magnitude < 1000.0:
+        return "%3.1f %s" % (num, "B")
+    index = min(int(math.log10(magnitude) // 3), len(HUMAN_FMT_UNITS) - 1)
+    return "%3.1f %s" % (num / 1000.0 ** index, HUMAN_FMT_UNITS[index])
 
 
-def header(lines):
+def header_text(lines):
     lines = [i for i in lines if i is not None]
-    total_length = len(max(lines, key=len)) + 4
-    print("#" * (total_length))
+    total_length = max(len(line) for line in lines) + 4
+    inner_length = total_length - 2
+    border = "#" * total_length
+    output = [border]
     for line in lines:
-        left_side = math.floor(((total_length - 2 - len(line.strip())) / 2))
-        print("#" + " " * left_side + line.strip() + " " * (total_length - len("#" + " " * left_side + line.strip()) - 1) + "#")
-    print("#" * total_length)
+        # Pad with the computed widths directly, no need to rebuild the line to
+        # measure it. Any odd leftover space lands on the right, str.center
+        # would shift it left for odd inner widths.
+        stripped = line.strip()
+        left_side = (inner_length - len(stripped)) // 2
+        output.append("#" + " " * left_side + stripped.ljust(inner_length - left_side) + "#")
+    output.append(border)
+    return "\n".join(output)
+
+
+def header(lines):
+    # Emit the whole box in one write, rather than a print (and tty write) per line
+    sys.stdout.write(header_text(lines) + "\n")
 
 
 RECOVERY_STATUS = None
@@ -78,14 +107,26 @@ def check_recovery():
     return RECOVERY_STATUS
 
 
+ROOT_PARTITION_INFO = None
+
+
+def get_root_partition_info():
+    global ROOT_PARTITION_INFO  # pylint: disable=global-statement # We need to cache the result
+
+    if ROOT_PARTITION_INFO is None:
+        # Note plistlib.loads accepts the raw bytes, no need to transcode
+        ROOT_PARTITION_INFO = plistlib.loads(subprocess.run("diskutil info -plist /".split(), stdout=subprocess.PIPE).stdout)
+
+    return ROOT_PARTITION_INFO
+
+
 def get_disk_path():
-    root_partition_info = plistlib.loads(subprocess.run("diskutil info -plist /".split(), stdout=subprocess.PIPE).stdout.decode().strip().encode())
-    root_mount_path = root_partition_info["DeviceIdentifier"]
+    root_mount_path = get_root_partition_info()["DeviceIdentifier"]
     root_mount_path = root_mount_path[:-2] if root_mount_path.count("s") > 1 else root_mount_path
     return root_mount_path
 
 def check_if_root_is_apfs_snapshot():
-    root_partition_info = plistlib.loads(subprocess.run("diskutil info -plist /".split(), stdout=subprocess.PIPE).stdout.decode().strip().encode())
+    root_partition_info = get_root_partition_info()
     try:
         is_snapshotted = root_partition_info["APFSSnapshot"]
     except KeyError:
@@ -118,18 +159,20 @@ def csr_dump():
         return 0
 
 
-def csr_decode(os_sip):
-    sip_int = csr_dump()
-    for i,  current_sip_bit in enumerate(sip_data.system_integrity_protection.csr_values):
-        if sip_int & (1 << i):
-            sip_data.system_integrity_protection.csr_values[current_sip_bit] = True
+# Bitmask of each SIP flag, in csr.h declaration order
+CSR_BITS = {current_sip_bit: 1 << i for i, current_sip_bit in enumerate(sip_data.system_integrity_protection.csr_values)}
 
+
+def csr_decode(os_sip):
     # Can be adjusted to whatever OS needs patching
-    sip_needs_change = all(sip_data.system_integrity_protection.csr_values[i] for i in os_sip)
-    if sip_needs_change is True:
-        return False
-    else:
-        return True
+    # SIP only needs change when every requested bit is already set,
+    # which a single mask compare answers without walking each bit.
+    # Also avoids mutating sip_data's csr_values table as the old
+    # bit-by-bit walk did.
+    sip_mask = 0
+    for current_sip_bit in os_sip:
+        sip_mask |= CSR_BITS[current_sip_bit]
+    return (csr_dump() & sip_mask) != sip_mask
 
 
 def friendly_hex(integer: int):
@@ -140,19 +183,40 @@ def amfi_status():
     amfi_1 = "amfi_get_out_of_my_way=0x1"
     amfi_2 = "amfi_get_out_of_my_way=1"
 
-    if get_nvram("OCLP-Settings", "4D1FDA02-38C7-4A6A-9CC6-4BCCA8B30102", decode=False):
+    # Each get_nvram() call is a full IOKit round trip, so only query each variable once
+    oclp_settings = get_nvram("OCLP-Settings", "4D1FDA02-38C7-4A6A-9CC6-4BCCA8B30102", decode=False)
+    if oclp_settings:
         if "-allow_amfi" in get_nvram("OCLP-Settings", "4D1FDA02-38C7-4A6A-9CC6-4BCCA8B30102", decode=True):
             return False
         else:
             return True
-    elif get_nvram("boot-args", decode=False):
-        if amfi_1 in get_nvram("boot-args", decode=False) or amfi_2 in get_nvram("boot-args", decode=False):
+    boot_args = get_nvram("boot-args", decode=False)
+    if boot_args:
+        if amfi_1 in boot_args or amfi_2 in boot_args:
             return False
     else:
         return True
 
 
+def check_class_registered(class_name):
+    # A class registered in the IORegistry means its kext is loaded,
+    # queried directly through IOKit instead of forking kmutil/kextstat.
+    # The singular lookup only hands back one entry to release, with no
+    # iterator left behind.
+    service = ioreg.IOServiceGetMatchingService(ioreg.kIOMasterPortDefault, ioreg.IOServiceMatching(class_name.encode()))
+    if service:
+        ioreg.IOObjectRelease(service)
+        return True
+    return False
+
+
 def check_kext_loaded(kext_name, os_version):
+    # Fast path: most kexts we care about register an IOKit class under their
+    # own name (ex. AppleALC), saving a multi-second kmutil invocation
+    if check_class_registered(kext_name):
+        return True
+    # Not every kext publishes a class matching its bundle name,
+    # so fall back to asking the kext manager
     if os_version > os_data.os_data.catalina:
         kext_loaded = subprocess.run(["kmutil", "showloaded", "--list-only", "--variant-suffix", "release"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
     else:
@@ -171,6 +235,10 @@ def check_oclp_boot():
 
 
 def check_monterey_wifi():
+    # Fast path: check the IORegistry for the ElCap classes before
+    # falling back to the (slow) kextcache query
+    if check_class_registered("IO80211ElCap") and check_class_registered("corecaptureElCap"):
+        return True
     IO80211ElCap = "com.apple.iokit.IO80211ElCap"
     CoreCaptureElCap = "com.apple.driver.corecaptureElCap"
     loaded_kexts: str = subprocess.run("kextcache".split(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT).stdout.decode()
@@ -180,27 +248,40 @@ def check_monterey_wifi():
         return False
 
 
+NON_METAL_ARCHS = None
+
+
+def get_non_metal_archs(device_probe):
+    # Built lazily off the passed-in module, as device_probe imports
+    # utilities and cannot be imported here at module scope
+    global NON_METAL_ARCHS  # pylint: disable=global-statement # We need to cache the result
+
+    if NON_METAL_ARCHS is None:
+        NON_METAL_ARCHS = frozenset({
+            device_probe.NVIDIA.Archs.Tesla,
+            device_probe.NVIDIA.Archs.Fermi,
+            device_probe.AMD.Archs.TeraScale_1,
+            device_probe.AMD.Archs.TeraScale_2,
+            device_probe.Intel.Archs.Iron_Lake,
+            device_probe.Intel.Archs.Sandy_Bridge,
+        })
+
+    return NON_METAL_ARCHS
+
+
 def check_metal_support(device_probe, computer):
     if computer.gpus:
+        non_metal_archs = get_non_metal_archs(device_probe)
         for gpu in computer.gpus:
-            if (
-                (gpu.arch in [
-                    device_probe.NVIDIA.Archs.Tesla, 
-                    device_probe.NVIDIA.Archs.Fermi, 
-                    device_probe.AMD.Archs.TeraScale_1, 
-                    device_probe.AMD.Archs.TeraScale_2, 
-                    device_probe.Intel.Archs.Iron_Lake, 
-                    device_probe.Intel.Archs.Sandy_Bridge
-                    ]
-                )
-            ):
+            if gpu.arch in non_metal_archs:
                 return False
     return True
 
 
 def check_filevault_skip():
     # Check whether we can skip FileVault check with Root Patching
-    if get_nvram("OCLP-Settings", "4D1FDA02-38C7-4A6A-9CC6-4BCCA8B30102", decode=False) and "-allow_fv" in get_nvram("OCLP-Settings", "4D1FDA02-38C7-4A6A-9CC6-4BCCA8B30102", decode=True):
+    oclp_settings = get_nvram("OCLP-Settings", "4D1FDA02-38C7-4A6A-9CC6-4BCCA8B30102", decode=True)
+    if oclp_settings and "-allow_fv" in oclp_settings:
         return True
     else:
         return False
@@ -223,8 +304,9 @@ def patching_status(os_sip, os):
         # Catalina and older supports individually disabling Library Validation
         amfi_enabled = False
 
-    if get_nvram("HardwareModel", "94B73556-2197-4702-82A8-3E1337DAFBFB", decode=False):
-        if get_nvram("HardwareModel", "94B73556-2197-4702-82A8-3E1337DAFBFB", decode=False) not in constants.Constants().sbm_values:
+    hardware_model = get_nvram("HardwareModel", "94B73556-2197-4702-82A8-3E1337DAFBFB", decode=False)
+    if hardware_model:
+        if hardware_model not in constants.Constants().sbm_values:
             sbm_enabled = False
     else:
         sbm_enabled = False
@@ -319,38 +401,56 @@ def get_rom(variable: str, *, decode: bool = False):
     return value
 
 
-def verify_network_connection(url):
+def head_request_status(url):
+    # Bare stdlib HEAD request, avoids dragging in the requests stack
+    # (urllib3, idna, certifi...) for simple reachability probes
+    split_url = urlsplit(url)
     try:
-        response = requests.head(url, timeout=5)
-        return True
-    except (requests.exceptions.Timeout, requests.exceptions.TooManyRedirects, requests.exceptions.ConnectionError, requests.exceptions.HTTPError):
-        return False
+        if split_url.scheme == "http":
+            connection = http.client.HTTPConnection(split_url.netloc, timeout=5)
+        else:
+            connection = http.client.HTTPSConnection(split_url.netloc, timeout=5)
+        try:
+            path = split_url.path or "/"
+            if split_url.query:
+                path += f"?{split_url.query}"
+            connection.request("HEAD", path)
+            return connection.getresponse().status
+        finally:
+            connection.close()
+    except (OSError, http.client.HTTPException):
+        return None
+
+
+def verify_network_connection(url):
+    return head_request_status(url) is not None
 
 def download_file(link, location, is_gui=None, verify_checksum=False):
-    if verify_network_connection(link):
+    response = None
+    try:
+        # A single streaming GET follows redirects (ex. Github's release links)
+        # and exposes the final headers, replacing the four HEAD round trips
+        # previously issued before any data flowed.
+        # The timeout only covers the connection attempt; reads must be allowed
+        # to stall indefinitely or slow networks abort mid-transfer.
+        # requests exceptions all derive from OSError (IOError)
+        response = get_session().get(link, stream=True, allow_redirects=True, timeout=(5, None))
+    except OSError:
+        pass
+    if response is not None:
         short_link = os.path.basename(link)
         if Path(location).exists():
             Path(location).unlink()
-        header = requests.head(link).headers
-        try:
-            # Try to get true file
-            # ex. Github's release links provides a "fake" header
-            # Thus need to resolve to the real link
-            link = requests.head(link).headers["location"]
-            header = requests.head(link).headers
-        except KeyError:
-            pass
         try:
             # Handle cases where Content-Length has garbage or is missing
-            total_file_size = int(requests.head(link).headers['Content-Length'])
-        except KeyError:
+            total_file_size = int(response.headers["Content-Length"])
+        except (KeyError, ValueError):
             total_file_size = 0
         if total_file_size > 1024:
             file_size_rounded = round(total_file_size / 1024 / 1024, 2)
             file_size_string = f" of {file_size_rounded}MB"
         else:
             file_size_string = ""
-        response = requests.get(link, stream=True)
         # SU Catalog's link is quite long, strip to make it bearable
         if "sucatalog.gz" in short_link:
             short_link = "sucatalog.gz"
@@ -359,34 +459,41 @@ def download_file(link, location, is_gui=None, verify_checksum=False):
         box_string = "#" * box_length
         dl = 0
         total_downloaded_string = ""
+        # Hash chunks as they arrive, rather than re-reading the whole file afterwards
+        checksum = hashlib.sha256() if verify_checksum is True else None
         global clear
+        if is_gui is None and clear:
+            # Print the box once, the status line below is rewritten in place
+            cls()
+            sys.stdout.write(f"{box_string}\n{header}\n{box_string}\n\n")
+        last_draw = 0.0
         with location.open("wb") as file:
             count = 0
             start = time.perf_counter()
             for chunk in response.iter_content(1024 * 1024 * 4):
                 dl += len(chunk)
                 file.write(chunk)
+                if checksum:
+                    checksum.update(chunk)
                 count += len(chunk)
-                if is_gui is None:
-                    if clear:
-                        cls()
-                        print(box_string)
-                        print(header)
-                        print(box_string)
-                        print("")
+                # Throttle redraws, per-chunk updates would dominate CPU on fast connections
+                now = time.monotonic()
+                if now - last_draw < 0.25:
+                    continue
+                last_draw = now
                 if total_file_size > 1024:
                     total_downloaded_string = f" ({round(float(dl / total_file_size * 100), 2)}%)"
-                print(f"{round(count / 1024 / 1024, 2)}MB Downloaded{file_size_string}{total_downloaded_string}\nAverage Download Speed: {round(dl//(time.perf_counter() - start) / 100000 / 8, 2)} MB/s")
-        
-        if verify_checksum is True:
-            # Verify checksum
-            # Note that this can be quite taxing on slower Macs
-            checksum = hashlib.sha256()
-            with location.open("rb") as file:
-                chunk = file.read(1024 * 1024 * 16)
-                while chunk:
-                    checksum.update(chunk)
-                    chunk = file.read(1024 * 1024 * 16)
+                status = f"{round(count / 1024 / 1024, 2)}MB Downloaded{file_size_string}{total_downloaded_string} - Average Download Speed: {round(dl//(time.perf_counter() - start) / 100000 / 8, 2)} MB/s"
+                if is_gui is None:
+                    sys.stdout.write(f"\r{status}")
+                    sys.stdout.flush()
+                else:
+                    print(status)
+            if is_gui is None:
+                sys.stdout.write("\n")
+
+
+        if checksum:
             return checksum
         return True
     else:
@@ -409,15 +516,22 @@ def dump_constants(constants):
     with open(os.path.join(os.path.expanduser('~'), 'Desktop', 'internal_data.txt'), 'w') as f:
         f.write(str(vars(constants)))
 
+@functools.lru_cache(maxsize=64)
+def get_diskutil_info(device):
+    # Memoized, as callers tend to re-query the same device several times in a
+    # row during a patching flow. Callers mutating disks should invalidate
+    # with get_diskutil_info.cache_clear()
+    try:
+        return plistlib.loads(subprocess.run(["diskutil", "info", "-plist", device], stdout=subprocess.PIPE).stdout)
+    except TypeError:
+        return None
+
+
 def find_apfs_physical_volume(device):
     # ex: disk3s1s1
     # return: [disk0s2]
-    disk_list = None
     physical_disks = []
-    try:
-        disk_list = plistlib.loads(subprocess.run(["diskutil", "info", "-plist", device], stdout=subprocess.PIPE).stdout)
-    except TypeError:
-        pass
+    disk_list = get_diskutil_info(device)
 
     if disk_list:
         try:
@@ -453,11 +567,7 @@ def clean_device_path(device_path: str):
 
 def find_disk_off_uuid(uuid):
     # Find disk by UUID
-    disk_list = None
-    try:
-        disk_list = plistlib.loads(subprocess.run(["diskutil", "info", "-plist", uuid], stdout=subprocess.PIPE).stdout)
-    except TypeError:
-        pass
+    disk_list = get_diskutil_info(uuid)
     if disk_list:
         try:
             return disk_list["DeviceIdentifier"]
@@ -467,11 +577,37 @@ def find_disk_off_uuid(uuid):
     
 
 def grab_mount_point_from_disk(disk):
-    data = plistlib.loads(subprocess.run(f"diskutil info -plist {disk}".split(), stdout=subprocess.PIPE).stdout.decode().strip().encode())
-    return data["MountPoint"]
+    return get_diskutil_info(disk)["MountPoint"]
+
+MONITORED_DISK_DRIVERS = {}
+
+
+def find_block_storage_driver(disk):
+    # Walk from the disk's IOMedia entry up to its IOBlockStorageDriver.
+    # Singular lookup, so no iterator is left behind to leak
+    entry = ioreg.IOServiceGetMatchingService(ioreg.kIOMasterPortDefault, {"IOProviderClass": "IOMedia", "IOPropertyMatch": {"BSD Name": disk}})
+    while entry:
+        if ioreg.IOObjectConformsTo(entry, "IOBlockStorageDriver".encode()):
+            return entry
+        parent = ioreg.IORegistryEntryGetParentEntry(entry, "IOService".encode(), None)[1]
+        ioreg.IOObjectRelease(entry)
+        entry = parent
+    return None
+
 
 def monitor_disk_output(disk):
     # Returns MB written on drive
+    # Read IOBlockStorageDriver's statistics directly where possible,
+    # a single kernel property read instead of an iostat fork/exec per poll.
+    # The matched driver entry is cached as this is called in progress loops.
+    if disk not in MONITORED_DISK_DRIVERS:
+        MONITORED_DISK_DRIVERS[disk] = find_block_storage_driver(disk)
+    driver = MONITORED_DISK_DRIVERS[disk]
+    if driver:
+        statistics = ioreg.corefoundation_to_native(ioreg.IORegistryEntryCreateCFProperty(driver, "Statistics", ioreg.kCFAllocatorDefault, ioreg.kNilOptions))
+        if statistics:
+            return statistics.get("Bytes (Write)", 0) / 1024 / 1024
+    # Fall back to iostat for disks without a statistics-publishing driver
     output = subprocess.check_output(["iostat", "-Id", disk])
     output = output.decode("utf-8")
     #  Grab second last entry (last is \n)
@@ -481,14 +617,11 @@ def monitor_disk_output(disk):
 
 def validate_link(link):
     # Check if link is 404
-    try:
-        response = requests.head(link, timeout=5)
-        if response.status_code == 404:
-            return False
-        else:
-            return True
-    except (requests.exceptions.Timeout, requests.exceptions.TooManyRedirects, requests.exceptions.ConnectionError, requests.exceptions.HTTPError):
+    status = head_request_status(link)
+    if status is None or status == 404:
         return False
+    else:
+        return True
 
 def block_os_updaters():
     # Disables any processes that would be likely to mess with 
@@ -499,18 +632,22 @@ def block_os_updaters():
         "Software Update",
         "MobileSoftwareUpdate",
     ]
-    output = subprocess.check_output(["ps", "-ax"])
-    lines = output.splitlines()
-    for line in lines:
-        entry = line.split() 
-        pid = entry[0].decode()
-        current_process = entry[3].decode()
-        for bad_process in bad_processes:
-            if bad_process in current_process:
-                if pid != "":
-                    print(f"- Killing Process: {pid} - {current_process.split('/')[-1]}")
-                    subprocess.run(["kill", "-9", pid])
-                    break
+    # pgrep filters the process table in C, rather than having us parse
+    # every line of 'ps -ax' in Python
+    killed_pids = set()
+    for bad_process in bad_processes:
+        for pid in subprocess.run(["pgrep", "-f", bad_process], stdout=subprocess.PIPE).stdout.split():
+            pid = int(pid)
+            if pid in killed_pids:
+                # Several patterns can match the same process
+                continue
+            killed_pids.add(pid)
+            print(f"- Killing Process: {pid} - {bad_process}")
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                # Process exited in the meantime, or is not ours to kill
+                pass
 
 def check_boot_mode():
     # Check whether we're in Safe Mode or not
@@ -526,7 +663,18 @@ def elevated(*args, **kwargs) -> subprocess.CompletedProcess:
         return subprocess.run(["sudo"] + [args[0][0]] + args[0][1:], **kwargs)
 
 
+CLI_ARGS = None
+CLI_ARGS_PARSED = False
+
+
 def check_cli_args():
+    # Called on every cls() and elevated() invocation, and sys.argv never
+    # changes during a run, so only build the parser once
+    global CLI_ARGS, CLI_ARGS_PARSED  # pylint: disable=global-statement # We need to cache the result
+
+    if CLI_ARGS_PARSED:
+        return CLI_ARGS
+
     parser = argparse.ArgumentParser()
     parser.add_argument("--build", help="Build OpenCore", action="store_true", required=False)
     parser.add_argument("--verbose", help="Enable verbose boot", action="store_true", required=False)
@@ -565,9 +713,11 @@ def check_cli_args():
 
     args = parser.parse_args()
     if not (args.build or args.patch_sys_vol or args.unpatch_sys_vol or args.validate or args.auto_patch):
-        return None
+        CLI_ARGS = None
     else:
-        return args
+        CLI_ARGS = args
+    CLI_ARGS_PARSED = True
+    return CLI_ARGS
 
 
 # def menu(title, prompt, menu_options, add_quit=True, auto_number=False, in_between=[], top_level=False):
@@ -620,27 +770,35 @@ class TUIMenu:
             self.add_menu_option(return_option[1], function=None, key=return_option[0])
             self.added_quit = True
 
+        # The menu does not change between redraws, so number the options
+        # and derive the hotkey list once rather than on every iteration
+        if self.auto_number:
+            for index, option in enumerate(self.options):
+                if not (index == (len(self.options) - 1) and self.add_quit):
+                    option[0] = str((index + 1))
+        keys = [option[0].upper() for option in self.options]
+        header_str = header_text(self.title)
+
         while True:
             cls()
-            header(self.title)
-            print()
+            # Build the whole frame and emit it with a single write,
+            # instead of one print (and tty write) per menu line
+            frame = [header_str, ""]
 
             for i in self.in_between:
-                print(i)
+                frame.append(i)
             if self.in_between:
-                print()
+                frame.append("")
 
-            for index, option in enumerate(self.options):
-                if self.auto_number and not (index == (len(self.options) - 1) and self.add_quit):
-                    option[0] = str((index + 1))
-                print(option[0] + ".  " + option[1])
+            for option in self.options:
+                frame.append(option[0] + ".  " + option[1])
                 for i in option[2]:
-                    print("\t" + i)
+                    frame.append("\t" + i)
 
-            print()
+            frame.append("")
+            sys.stdout.write("\n".join(frame) + "\n")
             selected = input(self.prompt)
 
-            keys = [option[0].upper() for option in self.options]
             if not selected or selected.upper() not in keys:
                 if self.loop:
                     continue
@@ -664,12 +822,12 @@ class TUIOnlyPrint:
 
     def start(self):
         cls()
-        header(self.title)
-        print()
+        output = [header_text(self.title), ""]
 
         for i in self.in_between:
-            print(i)
+            output.append(i)
         if self.in_between:
-            print()
+            output.append("")
 
+        sys.stdout.write("\n".join(output) + "\n")
         return input(self.prompt)